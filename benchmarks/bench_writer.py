@@ -0,0 +1,78 @@
+"""Benchmark save_to_csv against the parallel chunked writer.
+
+Run with ``PYTHONPATH=src python benchmarks/bench_writer.py --rows 5000000`` from the repo root.
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from yahoo_talib_pipeline.data_loader import save_to_csv
+from yahoo_talib_pipeline.writer import save_to_csv_parallel
+
+
+def make_frame(rows: int, tickers: int) -> pd.DataFrame:
+    """Build a synthetic enriched frame shaped like the pipeline output."""
+
+    rng = np.random.default_rng(0)
+    per_ticker = math.ceil(rows / tickers)
+    positions = np.arange(rows)
+    close = rng.normal(100, 5, rows)
+    return pd.DataFrame(
+        {
+            "ticker": np.array([f"T{i:04d}" for i in range(tickers)])[positions // per_ticker],
+            "Date": pd.date_range("2000-01-01", periods=per_ticker, freq="D")[positions % per_ticker],
+            "Open": close + rng.normal(0, 1, rows),
+            "High": close + 2,
+            "Low": close - 2,
+            "Close": close,
+            "Adj Close": close,
+            "Volume": rng.integers(1_000, 1_000_000, rows),
+            "RSI": rng.uniform(0, 100, rows),
+            "SMA_20": close + rng.normal(0, 0.5, rows),
+            "MACD": rng.normal(0, 1, rows),
+        }
+    )
+
+
+def _timed(label: str, func) -> float:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed:8.2f}s")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark CSV writers")
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--tickers", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-rows", type=int, default=250_000)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows, args.tickers)
+    print(f"rows={len(df.index)} columns={len(df.columns)}")
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        baseline = _timed("save_to_csv", lambda: save_to_csv(df, tmp_dir / "baseline.csv"))
+        parallel = _timed(
+            "save_to_csv_parallel",
+            lambda: save_to_csv_parallel(df, tmp_dir / "parallel.csv", args.workers, args.chunk_rows),
+        )
+        _timed(
+            "save_to_csv_parallel (gzip)",
+            lambda: save_to_csv_parallel(df, tmp_dir / "parallel.csv.gz", args.workers, args.chunk_rows),
+        )
+        identical = (tmp_dir / "baseline.csv").read_bytes() == (tmp_dir / "parallel.csv").read_bytes()
+        print(f"speedup={baseline / parallel:.2f}x identical_output={identical}")
+
+
+if __name__ == "__main__":
+    main()
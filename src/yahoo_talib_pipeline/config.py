@@ -6,6 +6,7 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 PRICES_CSV = DATA_DIR / "prices.csv"
 PRICES_WITH_INDICATORS_CSV = DATA_DIR / "prices_with_indicators.csv"
+SNAPSHOT_CSV = DATA_DIR / "latest_snapshot.csv"
 
 # Ensure data directory exists
 DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -8,6 +8,8 @@ from typing import Iterable
 from . import config
 from .data_loader import download_ohlcv, save_to_csv
 from .indicators import compute_indicators
+from .snapshot import load_snapshot, update_snapshot
+from .writer import save_to_csv_parallel
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +22,7 @@ def run_pipeline(
     indicators: Iterable[str] | None,
     data_dir: Path | None = None,
 ) -> None:
-    """Run the complete pipeline: download, save, compute indicators, save again."""
+    """Run the complete pipeline: download, save, compute indicators, save again, refresh snapshot."""
 
     indicators_list = list(indicators or [])
     logger.info(
@@ -39,18 +41,25 @@ def run_pipeline(
 
     prices_path = target_dir / config.PRICES_CSV.name
     prices_with_ind_path = target_dir / config.PRICES_WITH_INDICATORS_CSV.name
+    snapshot_path = target_dir / config.SNAPSHOT_CSV.name
 
     prices_df = download_ohlcv(tickers, start=start, end=end, interval=interval)
     save_to_csv(prices_df, prices_path)
 
     enriched_df = compute_indicators(prices_df, indicators_list) if indicators_list else prices_df
-    save_to_csv(enriched_df, prices_with_ind_path)
+    save_to_csv_parallel(enriched_df, prices_with_ind_path)
+
+    # Keep one row per ticker so screeners can skip the full history
+    snapshot_df = update_snapshot(load_snapshot(snapshot_path), enriched_df)
+    save_to_csv_parallel(snapshot_df, snapshot_path)
 
     result = {
         "prices_path": str(prices_path),
         "prices_rows": len(prices_df.index),
         "enriched_path": str(prices_with_ind_path),
         "enriched_rows": len(enriched_df.index),
+        "snapshot_path": str(snapshot_path),
+        "snapshot_rows": len(snapshot_df.index),
         "indicators": indicators_list,
     }
     logger.info(
@@ -0,0 +1,173 @@
+"""Latest-value snapshot table for fast cross-ticker screening."""
+from __future__ import annotations
+
+import operator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+
+_OPERATORS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+
+def _date_key(dates: pd.Series) -> pd.Series:
+    """Build a sortable key from Date values that may be strings or tz-aware."""
+
+    # Saved snapshots can mix daily and intraday date strings
+    return pd.to_datetime(dates, utc=True, format="ISO8601")
+
+
+def _parse_dates(dates: pd.Series) -> pd.Series:
+    """Parse Date values read back from CSV so they format like the enriched output."""
+
+    if pd.api.types.is_datetime64_any_dtype(dates):
+        return dates
+    try:
+        return pd.to_datetime(dates, format="ISO8601")
+    except (TypeError, ValueError):
+        # Mixed UTC offsets cannot share one tz-aware dtype
+        return pd.to_datetime(dates, utc=True, format="ISO8601")
+
+
+def build_snapshot(df: pd.DataFrame) -> pd.DataFrame:
+    """Collapse a price/indicator history into one row per ticker.
+
+    Args:
+        df: DataFrame with a "ticker" and "Date" column, e.g. the enriched output.
+
+    Returns:
+        DataFrame holding the latest bar with a Close per ticker, taken as a whole
+        row so prices and indicators always describe the same bar.
+    """
+
+    # yfinance can return an empty row for the current session; skip bars without a Close
+    bars = df.dropna(subset=["Close"]) if "Close" in df.columns else df
+    if bars.empty:
+        return pd.DataFrame(columns=list(df.columns))
+
+    ordered = bars.assign(_key=_date_key(bars["Date"])).sort_values("_key", kind="stable")
+    snapshot = ordered.drop_duplicates("ticker", keep="last").drop(columns="_key")
+    return snapshot.sort_values("ticker").reset_index(drop=True)[list(df.columns)]
+
+
+def update_snapshot(existing: pd.DataFrame | None, df: pd.DataFrame) -> pd.DataFrame:
+    """Merge fresh history into an existing snapshot, keeping the newest row per ticker.
+
+    Tickers absent from ``df`` keep their previous rows. On equal dates the fresh row wins.
+    """
+
+    fresh = build_snapshot(df)
+    if existing is None or existing.empty:
+        return fresh
+    if fresh.empty:
+        return existing
+
+    columns = list(existing.columns) + [col for col in fresh.columns if col not in existing.columns]
+    # A reloaded snapshot holds dates as strings; parse them so the merged column stays datetime64
+    existing = existing.assign(Date=_parse_dates(existing["Date"]))
+    fresh = fresh.assign(Date=_parse_dates(fresh["Date"]))
+    int_columns = {
+        col for frame in (existing, fresh) for col in frame.columns if pd.api.types.is_integer_dtype(frame[col])
+    }
+    combined = pd.concat(
+        [existing.assign(_key=_date_key(existing["Date"])), fresh.assign(_key=_date_key(fresh["Date"]))],
+        ignore_index=True,
+    )
+    combined = combined.sort_values("_key", kind="stable")
+    combined = combined.drop_duplicates("ticker", keep="last").drop(columns="_key")
+    # Columns missing on one side gain NaN; keep integer columns such as Volume as integers
+    combined = combined.astype({col: "Int64" for col in int_columns})
+    return combined.sort_values("ticker").reset_index(drop=True)[columns]
+
+
+def load_snapshot(path: str | Path) -> pd.DataFrame | None:
+    """Load a snapshot CSV, returning None when it does not exist yet."""
+
+    path_obj = Path(path)
+    if not path_obj.exists():
+        return None
+    snapshot = pd.read_csv(path_obj)
+    if "Date" in snapshot.columns:
+        snapshot["Date"] = _parse_dates(snapshot["Date"])
+    return snapshot
+
+
+def query_snapshot(
+    snapshot: pd.DataFrame,
+    conditions: Iterable[tuple[str, str, Any]] = (),
+    sort_by: str | None = None,
+    ascending: bool = True,
+    limit: int | None = None,
+) -> pd.DataFrame:
+    """Filter and sort a snapshot table.
+
+    Args:
+        snapshot: Snapshot DataFrame as produced by ``build_snapshot``.
+        conditions: Tuples of ``(column, op, value)`` combined with AND. ``op`` is one of
+            ``<``, ``<=``, ``>``, ``>=``, ``==``, ``!=``. A string ``value`` naming another
+            column compares the two columns, e.g. ``("Close", ">", "SMA_200")``.
+        sort_by: Optional column to sort the matches by.
+        ascending: Sort direction used with ``sort_by``.
+        limit: Optional maximum number of rows to return.
+
+    Returns:
+        DataFrame with the matching snapshot rows.
+    """
+
+    mask = np.ones(len(snapshot.index), dtype=bool)
+    for column, op, value in conditions:
+        if op not in _OPERATORS:
+            raise ValueError(f"Unsupported operator: {op}")
+        if column not in snapshot.columns:
+            raise ValueError(f"Unknown snapshot column: {column}")
+        left = snapshot[column].to_numpy()
+        if isinstance(value, str) and value in snapshot.columns:
+            right = snapshot[value].to_numpy()
+        else:
+            right = value
+        mask &= np.asarray(_OPERATORS[op](left, right), dtype=bool)
+
+    result = snapshot[mask]
+    if sort_by is not None:
+        result = result.sort_values(sort_by, ascending=ascending, na_position="last")
+    if limit is not None:
+        result = result.head(limit)
+    return result.reset_index(drop=True)
+
+
+@dataclass
+class SortedIndex:
+    """Sorted values of one snapshot column for range queries."""
+
+    column: str
+    values: np.ndarray
+    tickers: np.ndarray
+
+    def range(self, low: float | None = None, high: float | None = None) -> list[str]:
+        """Return tickers whose value lies within ``[low, high]``, ordered by value."""
+
+        start = 0 if low is None else int(np.searchsorted(self.values, low, side="left"))
+        stop = len(self.values) if high is None else int(np.searchsorted(self.values, high, side="right"))
+        return self.tickers[start:stop].tolist()
+
+
+def build_sorted_index(snapshot: pd.DataFrame, column: str) -> SortedIndex:
+    """Build a ``SortedIndex`` for a numeric snapshot column, skipping missing values."""
+
+    if column not in snapshot.columns:
+        raise ValueError(f"Unknown snapshot column: {column}")
+    values = pd.to_numeric(snapshot[column], errors="coerce").to_numpy(dtype=float)
+    tickers = snapshot["ticker"].to_numpy()
+    present = ~np.isnan(values)
+    values, tickers = values[present], tickers[present]
+    order = np.argsort(values, kind="stable")
+    return SortedIndex(column=column, values=values[order], tickers=tickers[order])
@@ -0,0 +1,177 @@
+"""Parallel chunked CSV writer for large enriched outputs."""
+from __future__ import annotations
+
+import gzip
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator
+
+import pandas as pd
+
+DEFAULT_CHUNK_ROWS = 250_000
+
+_SUFFIX_COMPRESSION = {".gz": "gzip", ".zst": "zstd"}
+
+
+def _resolve_compression(path: Path, compression: str | None) -> str | None:
+    """Map the requested compression to "gzip", "zstd" or None."""
+
+    if compression == "infer":
+        return _SUFFIX_COMPRESSION.get(path.suffix.lower())
+    if compression is None or compression in _SUFFIX_COMPRESSION.values():
+        return compression
+    raise ValueError(f"Unsupported compression: {compression}")
+
+
+def _compress(data: bytes, compression: str | None) -> bytes:
+    """Compress one encoded chunk; concatenated gzip members and zstd frames stay valid."""
+
+    if compression == "gzip":
+        return gzip.compress(data)
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise ImportError("zstd compression requires the 'zstandard' package.") from exc
+        return zstandard.ZstdCompressor().compress(data)
+    return data
+
+
+def _datetime_precision(series: pd.Series) -> int | None:
+    """Return the fractional-second digits pandas prints for a naive datetime column.
+
+    None means the column is written as plain dates. pandas picks this once per column,
+    so a chunk can differ from the full frame.
+    """
+
+    values = series.dropna()
+    if (values == values.dt.normalize()).all():
+        return None
+    if (values.dt.nanosecond != 0).any():
+        return 9
+    micro = values.dt.microsecond
+    if (micro % 1000 != 0).any():
+        return 6
+    if (micro != 0).any():
+        return 3
+    return 0
+
+
+def _format_datetimes(series: pd.Series, precision: int | None) -> pd.Series:
+    """Format a naive datetime column the way ``to_csv`` would at the given precision."""
+
+    if precision is None:
+        text = series.dt.strftime("%Y-%m-%d")
+    else:
+        text = series.dt.strftime("%Y-%m-%d %H:%M:%S")
+        if precision == 3:
+            text = text + "." + (series.dt.microsecond // 1000).astype("Int64").astype(str).str.zfill(3)
+        elif precision == 6:
+            text = text + "." + series.dt.microsecond.astype("Int64").astype(str).str.zfill(6)
+        elif precision == 9:
+            nanos = series.dt.microsecond.astype("Int64") * 1000 + series.dt.nanosecond.astype("Int64")
+            text = text + "." + nanos.astype(str).str.zfill(9)
+    return text.astype(object).where(series.notna(), None)
+
+
+def _encode_chunk(
+    chunk: pd.DataFrame,
+    header: bool,
+    date_precision: dict[str, int | None],
+    compression: str | None,
+) -> bytes:
+    """Encode a chunk to CSV bytes.
+
+    Naive datetime columns are formatted with the full-frame precision so they match a
+    single ``to_csv`` call. Timedelta columns are not adjusted and may format per chunk.
+    """
+
+    for col, precision in date_precision.items():
+        if _datetime_precision(chunk[col]) != precision:
+            chunk = chunk.assign(**{col: _format_datetimes(chunk[col], precision)})
+    data = chunk.to_csv(index=False, header=header).encode("utf-8")
+    return _compress(data, compression)
+
+
+def _iter_chunks(df: pd.DataFrame, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    for start in range(0, max(len(df.index), 1), chunk_rows):
+        yield df.iloc[start : start + chunk_rows]
+
+
+def _encode_chunks(
+    df: pd.DataFrame,
+    chunk_rows: int,
+    workers: int,
+    compression: str | None,
+) -> Iterator[bytes]:
+    """Yield encoded chunks in row order, keeping at most ``2 * workers`` chunks in flight."""
+
+    # Tz-aware columns are formatted per value, so only naive ones need the full-frame precision
+    date_precision = {
+        col: _datetime_precision(df[col])
+        for col in df.columns
+        if pd.api.types.is_datetime64_dtype(df[col])
+    }
+    chunks = enumerate(_iter_chunks(df, chunk_rows))
+
+    if workers <= 1 or len(df.index) <= chunk_rows:
+        for index, chunk in chunks:
+            yield _encode_chunk(chunk, index == 0, date_precision, compression)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque = deque()
+        for index, chunk in chunks:
+            pending.append(executor.submit(_encode_chunk, chunk, index == 0, date_precision, compression))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def save_to_csv_parallel(
+    df: pd.DataFrame,
+    path: str | bytes | None,
+    workers: int | None = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    compression: str | None = "infer",
+    atomic: bool = True,
+) -> None:
+    """Save a DataFrame to CSV, encoding row chunks in parallel worker processes.
+
+    Args:
+        df: DataFrame to save.
+        path: Target file path.
+        workers: Number of worker processes, defaults to the CPU count.
+        chunk_rows: Rows per encoded chunk.
+        compression: "gzip", "zstd", None, or "infer" to pick from the ``.gz``/``.zst`` suffix.
+        atomic: Write to a temporary file next to ``path`` and rename it into place.
+    """
+
+    if path is None:
+        raise ValueError("Path to save CSV cannot be None.")
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be a positive integer.")
+    path_obj = Path(os.fsdecode(path))
+    path_obj.parent.mkdir(parents=True, exist_ok=True)
+    codec = _resolve_compression(path_obj, compression)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # Readers of the target never see a partial file when writing atomically
+    target = path_obj.with_name(f".{path_obj.name}.{os.getpid()}.tmp") if atomic else path_obj
+    try:
+        with open(target, "wb") as handle:
+            for data in _encode_chunks(pd.DataFrame(df), chunk_rows, workers, codec):
+                handle.write(data)
+            if atomic:
+                handle.flush()
+                os.fsync(handle.fileno())
+        if atomic:
+            os.replace(target, path_obj)
+    except BaseException:
+        if atomic:
+            target.unlink(missing_ok=True)
+        raise
@@ -35,6 +35,10 @@ def test_run_pipeline_creates_files(tmp_path, monkeypatch):
     assert prices_path.exists()
     assert enriched_path.exists()
 
+    snapshot = pd.read_csv(tmp_path / config.SNAPSHOT_CSV.name)
+    assert list(snapshot["ticker"]) == ["AAA", "BBB"]
+    assert list(snapshot["Close"]) == [2.0, 2.0]
+
 
 def test_run_pipeline_defaults_to_config_dir(tmp_path, monkeypatch):
     def fake_download(tickers, start, end, interval):
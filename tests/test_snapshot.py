@@ -0,0 +1,101 @@
+import pandas as pd
+
+from yahoo_talib_pipeline.snapshot import (
+    build_snapshot,
+    build_sorted_index,
+    load_snapshot,
+    query_snapshot,
+    update_snapshot,
+)
+
+
+def _history():
+    return pd.DataFrame(
+        {
+            "ticker": ["AAA", "AAA", "BBB", "BBB", "CCC", "CCC"],
+            "Date": pd.to_datetime(["2023-01-01", "2023-01-02"] * 3),
+            "Close": [10.0, 11.0, 20.0, 19.0, 30.0, 35.0],
+            "RSI": [None, 25.0, 40.0, 28.0, 70.0, None],
+            "SMA_2": [None, 10.5, None, 19.5, None, 32.5],
+        }
+    )
+
+
+def test_build_snapshot_keeps_latest_row_per_ticker():
+    snapshot = build_snapshot(_history())
+
+    assert list(snapshot["ticker"]) == ["AAA", "BBB", "CCC"]
+    assert list(snapshot["Close"]) == [11.0, 19.0, 35.0]
+    # Indicators come from the same bar as the prices, even when missing
+    assert pd.isna(snapshot.loc[snapshot["ticker"] == "CCC", "RSI"].iloc[0])
+
+
+def test_build_snapshot_skips_latest_bar_without_close():
+    history = pd.DataFrame(
+        {
+            "ticker": ["AAA", "AAA"],
+            "Date": pd.to_datetime(["2023-01-01", "2023-01-02"]),
+            "Close": [10.0, None],
+            "RSI": [20.0, None],
+        }
+    )
+    snapshot = build_snapshot(history)
+
+    assert len(snapshot) == 1
+    assert snapshot["Date"].iloc[0] == pd.Timestamp("2023-01-01")
+    assert snapshot["Close"].iloc[0] == 10.0
+    assert snapshot["RSI"].iloc[0] == 20.0
+
+
+def test_update_snapshot_merges_with_saved_snapshot(tmp_path):
+    path = tmp_path / "latest_snapshot.csv"
+    build_snapshot(_history()).to_csv(path, index=False)
+
+    fresh = pd.DataFrame(
+        {
+            "ticker": ["AAA", "DDD"],
+            "Date": pd.to_datetime(["2023-01-03", "2023-01-03"]),
+            "Close": [12.0, 5.0],
+            "RSI": [22.0, 50.0],
+            "SMA_2": [11.5, 5.0],
+            "Volume": [100, 200],
+        }
+    )
+    snapshot = update_snapshot(load_snapshot(path), fresh)
+
+    assert list(snapshot["ticker"]) == ["AAA", "BBB", "CCC", "DDD"]
+    assert list(snapshot["Close"]) == [12.0, 19.0, 35.0, 5.0]
+
+    snapshot.to_csv(path, index=False)
+    saved = pd.read_csv(path, dtype=str, keep_default_na=False)
+    assert list(saved["Date"]) == ["2023-01-03", "2023-01-02", "2023-01-02", "2023-01-03"]
+    assert list(saved["Volume"]) == ["100", "", "", "200"]
+
+
+def test_load_snapshot_missing_file_returns_none(tmp_path):
+    assert load_snapshot(tmp_path / "missing.csv") is None
+
+
+def test_query_snapshot_filters_and_sorts():
+    snapshot = build_snapshot(_history())
+
+    result = query_snapshot(snapshot, [("RSI", "<", 30), ("Close", ">", "SMA_2")], sort_by="RSI")
+    assert list(result["ticker"]) == ["AAA"]
+
+    result = query_snapshot(snapshot, sort_by="Close", ascending=False, limit=2)
+    assert list(result["ticker"]) == ["CCC", "BBB"]
+
+    try:
+        query_snapshot(snapshot, [("RSI", "~", 30)])
+    except ValueError as exc:
+        assert "Unsupported operator" in str(exc)
+    else:
+        raise AssertionError("Unsupported operator should raise ValueError")
+
+
+def test_sorted_index_range_query():
+    index = build_sorted_index(build_snapshot(_history()), "RSI")
+
+    assert index.range(high=30) == ["AAA", "BBB"]
+    assert index.range(low=26, high=80) == ["BBB"]
+    assert index.range() == ["AAA", "BBB"]
@@ -0,0 +1,80 @@
+import gzip
+
+import pandas as pd
+
+from yahoo_talib_pipeline.data_loader import save_to_csv
+from yahoo_talib_pipeline.writer import save_to_csv_parallel
+
+
+def _frame(rows=10):
+    return pd.DataFrame(
+        {
+            "ticker": ["AAA"] * rows,
+            # Only the last row has a time part, so earlier chunks are midnight-only
+            "Date": list(pd.date_range("2023-01-01", periods=rows - 1, freq="D")) + [pd.Timestamp("2023-02-01 10:30")],
+            "Close": [float(i) + 0.5 for i in range(rows)],
+            "RSI": [None] * 3 + [50.0] * (rows - 3),
+        }
+    )
+
+
+def test_parallel_writer_matches_save_to_csv(tmp_path):
+    df = _frame()
+    save_to_csv(df, tmp_path / "expected.csv")
+    save_to_csv_parallel(df, tmp_path / "parallel.csv", workers=2, chunk_rows=3)
+
+    assert (tmp_path / "parallel.csv").read_bytes() == (tmp_path / "expected.csv").read_bytes()
+    assert [p.name for p in tmp_path.iterdir() if p.name.endswith(".tmp")] == []
+
+
+def test_parallel_writer_keeps_fractional_seconds_precision(tmp_path):
+    df = pd.DataFrame(
+        {
+            "ticker": ["AAA"] * 6,
+            # Only the last row has fractional seconds, so earlier chunks have none
+            "Date": pd.to_datetime(["2023-01-02 10:00:00.0"] * 5 + ["2023-01-02 10:00:00.5"]),
+            "Close": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+        }
+    )
+    save_to_csv(df, tmp_path / "expected.csv")
+    save_to_csv_parallel(df, tmp_path / "parallel.csv", workers=2, chunk_rows=3)
+
+    assert (tmp_path / "parallel.csv").read_bytes() == (tmp_path / "expected.csv").read_bytes()
+
+
+def test_parallel_writer_gzip_from_suffix(tmp_path):
+    df = _frame()
+    save_to_csv(df, tmp_path / "expected.csv")
+    save_to_csv_parallel(df, tmp_path / "parallel.csv.gz", workers=2, chunk_rows=4)
+
+    with gzip.open(tmp_path / "parallel.csv.gz", "rb") as handle:
+        assert handle.read() == (tmp_path / "expected.csv").read_bytes()
+
+
+def test_parallel_writer_failure_keeps_existing_file(tmp_path, monkeypatch):
+    path = tmp_path / "out.csv"
+    path.write_text("old")
+
+    def failing_encode(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr("yahoo_talib_pipeline.writer._encode_chunk", failing_encode)
+
+    try:
+        save_to_csv_parallel(_frame(), path, workers=1)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("Encoding failure should propagate")
+
+    assert path.read_text() == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["out.csv"]
+
+
+def test_parallel_writer_rejects_unknown_compression(tmp_path):
+    try:
+        save_to_csv_parallel(_frame(), tmp_path / "out.csv", compression="bz2")
+    except ValueError as exc:
+        assert "Unsupported compression" in str(exc)
+    else:
+        raise AssertionError("Unsupported compression should raise ValueError")